@@ -2,7 +2,25 @@ from orcapod.types.semantic_types import SemanticTypeRegistry
 from orcapod.types import default_registry
 from orcapod.protocols import hashing_protocols as hp
 from orcapod.hashing.defaults import get_default_arrow_hasher, get_default_object_hasher
-from dataclasses import dataclass
+from orcapod.hashing import hash_utils
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any
+from weakref import WeakValueDictionary
+
+import pyarrow as pa
+import xxhash
+
+
+class _StreamSet(frozenset):
+    """
+    Frozenset of streams that also holds on to every given stream, including ones
+    dropped as equal to another member, so that the ids used to intern it stay
+    valid while it is alive.
+    """
+
+    __slots__ = ("_members",)
 
 
 @dataclass
@@ -11,6 +29,50 @@ class DataContext:
     semantic_type_registry: SemanticTypeRegistry
     arrow_hasher: hp.ArrowHasher
     object_hasher: hp.ObjectHasher
+    _streamset_interns: WeakValueDictionary[frozenset[int], frozenset] = field(
+        default_factory=WeakValueDictionary, init=False, repr=False, compare=False
+    )
+
+    @cached_property
+    def context_key_arrow_array(self) -> pa.Array:
+        """
+        Single-element Arrow array holding the context key, used when appending the
+        context column to tables. Arrow arrays are immutable so it is safely shared.
+        """
+        return pa.array([self.context_key], type=pa.large_string())
+
+    def fast_identity_hash(self, structure: Any) -> str:
+        """
+        Hash an identity structure with a fast non-cryptographic hash.
+
+        The structure is processed the same way as by the object hasher, so the
+        result is deterministic across processes, but it is not collision
+        resistant against crafted input. Use the object hasher where that matters.
+        """
+        processed = hash_utils.process_structure(
+            structure,
+            function_info_extractor=getattr(
+                self.object_hasher, "function_info_extractor", None
+            ),
+        )
+        return "xxh3_64@" + xxhash.xxh3_64_hexdigest(
+            hash_utils.serialize_through_json(processed)
+        )
+
+    def intern_streamset(self, streams: Collection[Any]) -> frozenset:
+        """
+        Return the streams as a frozenset, reusing the same object for repeated
+        requests on the same stream objects while it is still referenced.
+        Building the set hashes each stream, which covers its whole upstream
+        graph, so interning spares commutative kernels from doing so repeatedly.
+        """
+        key = frozenset(map(id, streams))
+        streamset = self._streamset_interns.get(key)
+        if streamset is None:
+            streamset = _StreamSet(streams)
+            streamset._members = tuple(streams)
+            self._streamset_interns[key] = streamset
+        return streamset
 
     @staticmethod
     def resolve_data_context(data_context: "str | DataContext | None") -> "DataContext":
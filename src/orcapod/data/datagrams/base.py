@@ -116,6 +116,8 @@ class BaseDatagram(ABC):
     is interpreted and used is left to concrete implementations.
     """
 
+    __slots__ = ("_data_context",)
+
     def __init__(self, data_context: DataContext | str | None = None) -> None:
         """
         Initialize base datagram with data context.
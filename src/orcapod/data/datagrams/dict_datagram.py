@@ -1,6 +1,9 @@
 import logging
-from collections.abc import Collection, Iterator, Mapping
-from typing import Self, cast
+import sys
+from collections import OrderedDict
+from collections.abc import Collection, Iterable, Iterator, Mapping
+from functools import lru_cache
+from typing import Any, ClassVar, Self, cast
 
 import pyarrow as pa
 
@@ -13,10 +16,66 @@ from orcapod.types import TypeSpec, schemas
 from orcapod.types import typespec_utils as tsutils
 from orcapod.types.core import DataValue
 from orcapod.types.semantic_converter import SemanticConverter
+from orcapod.types.semantic_types import SemanticTypeRegistry
 from orcapod.utils import arrow_utils
 
 logger = logging.getLogger(__name__)
 
+# Value types that are hashable and compare equal only for equal content, making
+# them safe to include in the content hash cache key
+_FINGERPRINTABLE_TYPES = (str, int, float, bool, bytes, type(None))
+
+# Schema of the context column, identical for every datagram
+_CONTEXT_SCHEMA = pa.schema([pa.field(constants.CONTEXT_KEY, pa.string())])
+
+
+def _intern_column_name(name: str) -> str:
+    # only exact str instances can be interned; subclasses such as StrEnum
+    # members are kept as given
+    return sys.intern(name) if type(name) is str else name
+
+
+# Datagrams flowing through a stream typically share the same schema. Schema and
+# semantic converter construction are therefore memoized on the (hashable) tuple
+# of resolved (column name, type) pairs. Cached objects are shared across
+# datagrams and must be treated as read-only. Semantic converters are further keyed
+# on the registry generation, as registering semantic types alters the conversion.
+@lru_cache(maxsize=256)
+def _cached_python_schema(
+    schema_key: tuple[tuple[str, type], ...],
+) -> schemas.PythonSchema:
+    return schemas.PythonSchema(schema_key)
+
+
+@lru_cache(maxsize=256)
+def _cached_semantic_converter(
+    schema_key: tuple[tuple[str, type], ...],
+    semantic_type_registry: SemanticTypeRegistry,
+    registry_generation: int,
+) -> SemanticConverter:
+    return SemanticConverter.from_semantic_schema(
+        _cached_python_schema(schema_key).to_semantic_schema(
+            semantic_type_registry=semantic_type_registry
+        )
+    )
+
+
+def _python_schema_from_dict(
+    data: Mapping[str, DataValue], typespec: TypeSpec | None = None
+) -> tuple[schemas.PythonSchema, tuple[tuple[str, type], ...] | None]:
+    """
+    Build the Python schema for the given data, reusing a cached instance when possible.
+
+    Returns the schema along with the key under which it was cached, or None if the
+    schema contains unhashable types and could not be cached.
+    """
+    typespec = tsutils.get_typespec_from_dict(data, typespec)
+    schema_key = tuple(typespec.items())
+    try:
+        return _cached_python_schema(schema_key), schema_key
+    except TypeError:
+        return schemas.PythonSchema(typespec), None
+
 
 class DictDatagram(BaseDatagram):
     """
@@ -50,6 +109,36 @@ class DictDatagram(BaseDatagram):
         >>> updated = datagram.update(name="Alice Smith")
     """
 
+    __slots__ = (
+        "_cached_content_hash",
+        "_cached_data_arrow_schema",
+        "_cached_data_table",
+        "_cached_meta_arrow_schema",
+        "_cached_meta_python_schema",
+        "_cached_meta_table",
+        "_data",
+        "_data_python_schema",
+        "_meta_columns",
+        "_meta_data",
+        "_meta_prefix_select_cache",
+        "_meta_typespec",
+        "_semantic_converter",
+    )
+
+    # Shared across instances: LRU mapping of content keys to full content hashes
+    _content_hash_cache: ClassVar[OrderedDict[tuple, str]] = OrderedDict()
+    _CONTENT_HASH_CACHE_SIZE: ClassVar[int] = 1024
+    # Largest total length of str and bytes values kept in a cache key, bounding
+    # the memory held by the cache and the cost of comparing keys
+    _CONTENT_HASH_KEY_MAX_SIZE: ClassVar[int] = 256
+
+    # Class name used in representations, kept up to date for subclasses
+    _cls_name = "DictDatagram"
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._cls_name = cls.__name__
+
     def __init__(
         self,
         data: Mapping[str, DataValue],
@@ -73,59 +162,199 @@ class DictDatagram(BaseDatagram):
             The input data is automatically split into data, meta, and context
             components based on column naming conventions.
         """
-        # Parse through data and extract different column types
+        data_columns, meta_columns, final_context = self._split_columns(
+            data, data_context
+        )
+
+        # Initialize base class with data context
+        super().__init__(final_context)
+
+        # Store data and meta components separately (immutable)
+        self._data = data_columns
+        if meta_info is not None:
+            meta_columns.update(meta_info)
+        self._meta_data = meta_columns
+
+        self._init_schemas(typespec, semantic_converter)
+
+    @staticmethod
+    def _split_columns(
+        data: Mapping[str, DataValue],
+        data_context: str | DataContext | None,
+    ) -> tuple[dict[str, DataValue], dict[str, DataValue], str | DataContext | None]:
+        """
+        Split a mapping into data columns, meta columns and the data context.
+
+        The context column is only used when no explicit data context is given.
+        """
+        # Parse through data and extract different column types in a single pass.
+        # Constants are bound to locals as they are computed properties.
+        meta_prefix = constants.META_PREFIX
+        context_key = constants.CONTEXT_KEY
         data_columns = {}
         meta_columns = {}
         extracted_context = None
 
-        for k, v in data.items():
-            if k == constants.CONTEXT_KEY:
+        # Column names are interned, as datagrams sharing a schema repeat the
+        # same names and interned keys make subsequent dict lookups cheaper.
+        for k in data:
+            if k.startswith(meta_prefix):
+                # Double underscore = meta metadata
+                meta_columns[_intern_column_name(k)] = data[k]
+            elif k == context_key:
                 # Extract data context but keep it separate from meta data
                 if data_context is None:
-                    extracted_context = v
+                    extracted_context = data[k]
                 # Don't store context in meta_data - it's managed separately
-            elif k.startswith(constants.META_PREFIX):
-                # Double underscore = meta metadata
-                meta_columns[k] = v
             else:
                 # Everything else = user data (including _source_ and semantic types)
-                data_columns[k] = v
+                data_columns[_intern_column_name(k)] = data[k]
 
-        # Initialize base class with data context
-        final_context = data_context or cast(str, extracted_context)
-        super().__init__(final_context)
+        return data_columns, meta_columns, data_context or cast(str, extracted_context)
 
-        # Store data and meta components separately (immutable)
-        self._data = dict(data_columns)
-        if meta_info is not None:
-            meta_columns.update(meta_info)
-        self._meta_data = meta_columns
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Mapping[str, DataValue]],
+        typespec: TypeSpec | None = None,
+        data_context: str | DataContext | None = None,
+    ) -> list[Self]:
+        """
+        Create one datagram per record, sharing schema inference across the batch.
 
-        # Combine provided typespec info with inferred typespec from content
-        # If the column value is None and no type spec is provided, defaults to str.
-        self._data_python_schema = schemas.PythonSchema(
-            tsutils.get_typespec_from_dict(
-                self._data,
-                typespec,
+        Records are expected to be homogeneous: the data schema and semantic
+        converter are inferred once and reused for every following record with
+        the same data columns, value types and data context. Records that differ
+        are handled as individual construction would.
+
+        Args:
+            records: Source data mappings, each split as in `__init__`.
+            typespec: Optional type specification for fields.
+            data_context: Data context for semantic type resolution.
+
+        Returns:
+            List of datagrams, in the order of the records.
+        """
+        datagrams = []
+        reference: DictDatagram | None = None
+        reference_signature = None
+        for record in records:
+            data, meta, context, extra = cls._split_record(record, data_context)
+            # the inferred schema only depends on the column names and value types
+            signature = (context, tuple(data), tuple(map(type, data.values())))
+            if reference is not None and signature == reference_signature:
+                datagram = cls._from_split(
+                    data,
+                    meta,
+                    typespec=typespec,
+                    semantic_converter=reference._semantic_converter,
+                    data_context=context,
+                    data_python_schema=reference._data_python_schema,
+                    **extra,
+                )
+            else:
+                datagram = cls._from_split(
+                    data, meta, typespec=typespec, data_context=context, **extra
+                )
+                reference, reference_signature = datagram, signature
+            datagrams.append(datagram)
+        return datagrams
+
+    @classmethod
+    def _split_record(
+        cls,
+        record: Mapping[str, DataValue],
+        data_context: str | DataContext | None,
+    ) -> tuple[
+        dict[str, DataValue],
+        dict[str, DataValue],
+        str | DataContext | None,
+        dict[str, Any],
+    ]:
+        """
+        Split a record as `__init__` would, returning the data columns, meta columns
+        and data context, along with any further keyword arguments that subclasses
+        need passed to `_from_split`.
+        """
+        return *cls._split_columns(record, data_context), {}
+
+    @classmethod
+    def _from_split(
+        cls,
+        data: dict[str, DataValue],
+        meta: dict[str, DataValue],
+        *,
+        typespec: TypeSpec | None = None,
+        semantic_converter: SemanticConverter | None = None,
+        data_context: str | DataContext | None = None,
+        data_python_schema: schemas.PythonSchema | None = None,
+    ) -> Self:
+        """
+        Create a new instance from already separated data and meta columns.
+
+        Skips the column classification performed in `__init__`, and is used by
+        operations deriving a new datagram from an existing one. The passed
+        dictionaries are taken over by the new instance and must not be mutated.
+        When `data_python_schema` is given, it must describe `data` exactly and
+        is used as is instead of inferring the schema again.
+        """
+        instance = cls.__new__(cls)
+        super(DictDatagram, instance).__init__(data_context)
+        instance._data = data
+        instance._meta_data = meta
+        instance._init_schemas(typespec, semantic_converter, data_python_schema)
+        return instance
+
+    def _share_data_caches(self, derived: Self) -> Self:
+        """
+        Hand the caches built from data columns over to a derived datagram.
+
+        Only valid when `derived` holds the same data columns, semantic converter
+        and data context as this datagram, i.e. when only meta columns differ.
+        """
+        derived._cached_data_table = self._cached_data_table
+        derived._cached_data_arrow_schema = self._cached_data_arrow_schema
+        derived._cached_content_hash = self._cached_content_hash
+        return derived
+
+    def _init_schemas(
+        self,
+        typespec: TypeSpec | None,
+        semantic_converter: SemanticConverter | None,
+        data_python_schema: schemas.PythonSchema | None = None,
+    ) -> None:
+        """Set up schemas, semantic converter and caches from the stored columns."""
+        # Meta columns never change after construction
+        self._meta_columns = tuple(self._meta_data)
+
+        if data_python_schema is not None:
+            # Schema carried over from a datagram with the same data columns
+            self._data_python_schema, schema_key = data_python_schema, None
+        else:
+            # Combine provided typespec info with inferred typespec from content
+            # If the column value is None and no type spec is provided, defaults to str.
+            self._data_python_schema, schema_key = _python_schema_from_dict(
+                self._data, typespec
             )
-        )
 
         # Create semantic converter
         if semantic_converter is None:
-            semantic_converter = SemanticConverter.from_semantic_schema(
-                self._data_python_schema.to_semantic_schema(
-                    semantic_type_registry=self._data_context.semantic_type_registry
-                ),
-            )
+            registry = self._data_context.semantic_type_registry
+            if schema_key is not None:
+                semantic_converter = _cached_semantic_converter(
+                    schema_key, registry, registry.generation
+                )
+            else:
+                semantic_converter = SemanticConverter.from_semantic_schema(
+                    self._data_python_schema.to_semantic_schema(
+                        semantic_type_registry=registry
+                    ),
+                )
         self._semantic_converter = semantic_converter
 
-        # Create schema for meta data
-        self._meta_python_schema = schemas.PythonSchema(
-            tsutils.get_typespec_from_dict(
-                self._meta_data,
-                typespec=typespec,
-            )
-        )
+        # Schema for meta data is only built when first needed
+        self._meta_typespec = typespec
+        self._cached_meta_python_schema: schemas.PythonSchema | None = None
 
         # Initialize caches
         self._cached_data_table: pa.Table | None = None
@@ -133,19 +362,24 @@ class DictDatagram(BaseDatagram):
         self._cached_content_hash: str | None = None
         self._cached_data_arrow_schema: pa.Schema | None = None
         self._cached_meta_arrow_schema: pa.Schema | None = None
+        # created on the first prefix-based meta column selection
+        self._meta_prefix_select_cache: (
+            dict[frozenset[str], tuple[tuple[str, ...], pa.Schema]] | None
+        ) = None
 
     # 1. Core Properties (Identity & Structure)
     @property
     def meta_columns(self) -> tuple[str, ...]:
         """Return tuple of meta column names."""
-        return tuple(self._meta_data.keys())
+        return self._meta_columns
 
     # 2. Dict-like Interface (Data Access)
     def __getitem__(self, key: str) -> DataValue:
         """Get data column value by key."""
-        if key not in self._data:
-            raise KeyError(f"Data column '{key}' not found")
-        return self._data[key]
+        try:
+            return self._data[key]
+        except KeyError:
+            raise KeyError(f"Data column '{key}' not found") from None
 
     def __contains__(self, key: str) -> bool:
         """Check if data column exists."""
@@ -182,10 +416,9 @@ class DictDatagram(BaseDatagram):
                 result_keys.extend(self.meta_columns)
             elif isinstance(include_meta_columns, Collection):
                 # Filter meta columns by prefix matching
+                prefixes = tuple(include_meta_columns)
                 filtered_meta_cols = [
-                    col
-                    for col in self.meta_columns
-                    if any(col.startswith(prefix) for prefix in include_meta_columns)
+                    col for col in self.meta_columns if col.startswith(prefixes)
                 ]
                 result_keys.extend(filtered_meta_cols)
 
@@ -213,8 +446,11 @@ class DictDatagram(BaseDatagram):
         include_meta_columns = include_all_info or include_meta_columns
         include_context = include_all_info or include_context
 
-        # Start with data schema
-        schema = dict(self._data_python_schema)
+        # Start with a copy of the data schema; the stored schema is shared and
+        # must not be handed out to callers that may modify it
+        schema = self._data_python_schema.copy()
+        if not include_context and not include_meta_columns:
+            return schema
 
         # Add context if requested
         if include_context:
@@ -223,16 +459,17 @@ class DictDatagram(BaseDatagram):
         # Add meta schema if requested
         if include_meta_columns and self._meta_data:
             if include_meta_columns is True:
-                schema.update(self._meta_python_schema)
+                schema.update(self._get_meta_python_schema())
             elif isinstance(include_meta_columns, Collection):
+                prefixes = tuple(include_meta_columns)
                 filtered_meta_schema = {
                     k: v
-                    for k, v in self._meta_python_schema.items()
-                    if any(k.startswith(prefix) for prefix in include_meta_columns)
+                    for k, v in self._get_meta_python_schema().items()
+                    if k.startswith(prefixes)
                 }
                 schema.update(filtered_meta_schema)
 
-        return schemas.PythonSchema(schema)
+        return schema
 
     def arrow_schema(
         self,
@@ -256,49 +493,22 @@ class DictDatagram(BaseDatagram):
         include_meta_columns = include_all_info or include_meta_columns
         include_context = include_all_info or include_context
 
-        # Build data schema (cached)
-        if self._cached_data_arrow_schema is None:
-            self._cached_data_arrow_schema = (
-                self._semantic_converter.from_python_to_arrow_schema(
-                    self._data_python_schema
-                )
-            )
-
-        all_schemas = [self._cached_data_arrow_schema]
+        all_schemas = [self._get_data_arrow_schema()]
 
         # Add context schema if requested
         if include_context:
-            context_schema = pa.schema([pa.field(constants.CONTEXT_KEY, pa.string())])
-            all_schemas.append(context_schema)
+            all_schemas.append(_CONTEXT_SCHEMA)
 
         # Add meta schema if requested
         if include_meta_columns and self._meta_data:
-            if self._cached_meta_arrow_schema is None:
-                self._cached_meta_arrow_schema = (
-                    self._semantic_converter.from_python_to_arrow_schema(
-                        self._meta_python_schema
-                    )
-                )
-
-            assert self._cached_meta_arrow_schema is not None, (
-                "Meta Arrow schema should be initialized by now"
-            )
-
             if include_meta_columns is True:
-                meta_schema = self._cached_meta_arrow_schema
+                meta_schema = self._get_meta_arrow_schema()
             elif isinstance(include_meta_columns, Collection):
                 # Filter meta schema by prefix matching
-                matched_fields = [
-                    field
-                    for field in self._cached_meta_arrow_schema
-                    if any(
-                        field.name.startswith(prefix) for prefix in include_meta_columns
-                    )
-                ]
-                if matched_fields:
-                    meta_schema = pa.schema(matched_fields)
-                else:
-                    meta_schema = None
+                matched_cols, matched_schema = self._select_meta_by_prefix(
+                    include_meta_columns
+                )
+                meta_schema = matched_schema if matched_cols else None
             else:
                 meta_schema = None
 
@@ -316,12 +526,56 @@ class DictDatagram(BaseDatagram):
             Hash string of the datagram content
         """
         if self._cached_content_hash is None:
-            self._cached_content_hash = self._data_context.arrow_hasher.hash_table(
-                self.as_table(include_meta_columns=False, include_context=False),
-                prefix_hasher_id=True,
-            )
+            # Datagrams holding only primitive values are looked up by content so
+            # that recurring content can skip Arrow table construction and hashing
+            cache = DictDatagram._content_hash_cache
+            key = self._content_hash_key()
+            # pop and reinsert rather than move_to_end, which could fail if
+            # another thread evicted the key in between
+            content_hash = cache.pop(key, None) if key is not None else None
+            if content_hash is None:
+                content_hash = self._data_context.arrow_hasher.hash_table(
+                    self.as_table(include_meta_columns=False, include_context=False),
+                    prefix_hasher_id=True,
+                )
+            if key is not None:
+                cache[key] = content_hash
+                if len(cache) > self._CONTENT_HASH_CACHE_SIZE:
+                    cache.popitem(last=False)
+            self._cached_content_hash = content_hash
         return self._cached_content_hash
 
+    def _content_hash_key(self) -> tuple | None:
+        """
+        Build the content hash cache key from the data context, the Python schema and
+        the values of the data columns.
+
+        Only produced when every value is of a primitive type, the str and bytes
+        values are short and the schema is hashable. Zero floats are excluded, as
+        0.0 and -0.0 compare equal but differ in content. Returns None otherwise.
+        """
+        size = 0
+        for value in self._data.values():
+            value_type = type(value)
+            if value_type not in _FINGERPRINTABLE_TYPES or (
+                value_type is float and not value
+            ):
+                return None
+            if value_type is str or value_type is bytes:
+                size += len(value)
+                if size > self._CONTENT_HASH_KEY_MAX_SIZE:
+                    return None
+        key = (
+            self._data_context.context_key,
+            tuple(self._data_python_schema.items()),
+            tuple(self._data.items()),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     # 4. Format Conversions (Export)
     def as_dict(
         self,
@@ -358,39 +612,85 @@ class DictDatagram(BaseDatagram):
                 result_dict.update(self._meta_data)
             elif isinstance(include_meta_columns, Collection):
                 # Include only meta columns matching prefixes
+                prefixes = tuple(include_meta_columns)
                 filtered_meta_data = {
-                    k: v
-                    for k, v in self._meta_data.items()
-                    if any(k.startswith(prefix) for prefix in include_meta_columns)
+                    k: v for k, v in self._meta_data.items() if k.startswith(prefixes)
                 }
                 result_dict.update(filtered_meta_data)
 
         return result_dict
 
+    # Cached Arrow representations. The getters only check and return the cached
+    # value; building it on a miss is left to the corresponding _build_* method.
+    def _get_data_arrow_table(self) -> pa.Table:
+        if self._cached_data_table is None:
+            self._cached_data_table = self._build_data_arrow_table()
+        return self._cached_data_table
+
+    def _build_data_arrow_table(self) -> pa.Table:
+        return self._semantic_converter.from_python_to_arrow(
+            self._data,
+            self._data_python_schema,
+        )
+
+    def _get_data_arrow_schema(self) -> pa.Schema:
+        if self._cached_data_arrow_schema is None:
+            self._cached_data_arrow_schema = self._build_data_arrow_schema()
+        return self._cached_data_arrow_schema
+
+    def _build_data_arrow_schema(self) -> pa.Schema:
+        return self._semantic_converter.from_python_to_arrow_schema(
+            self._data_python_schema
+        )
+
     def _get_meta_arrow_table(self) -> pa.Table:
         if self._cached_meta_table is None:
-            arrow_schema = self._get_meta_arrow_schema()
-            self._cached_meta_table = pa.Table.from_pylist(
-                [self._meta_data],
-                schema=arrow_schema,
-            )
-        assert self._cached_meta_table is not None, (
-            "Meta Arrow table should be initialized by now"
-        )
+            self._cached_meta_table = self._build_meta_arrow_table()
         return self._cached_meta_table
 
+    def _build_meta_arrow_table(self) -> pa.Table:
+        # Single row: build the columns directly rather than going through rows
+        return pa.Table.from_pydict(
+            {k: [v] for k, v in self._meta_data.items()},
+            schema=self._get_meta_arrow_schema(),
+        )
+
+    def _get_meta_python_schema(self) -> schemas.PythonSchema:
+        if self._cached_meta_python_schema is None:
+            self._cached_meta_python_schema, _ = _python_schema_from_dict(
+                self._meta_data, self._meta_typespec
+            )
+        return self._cached_meta_python_schema
+
     def _get_meta_arrow_schema(self) -> pa.Schema:
         if self._cached_meta_arrow_schema is None:
-            self._cached_meta_arrow_schema = (
-                self._semantic_converter.from_python_to_arrow_schema(
-                    self._meta_python_schema
-                )
-            )
-        assert self._cached_meta_arrow_schema is not None, (
-            "Meta Arrow schema should be initialized by now"
-        )
+            self._cached_meta_arrow_schema = self._build_meta_arrow_schema()
         return self._cached_meta_arrow_schema
 
+    def _build_meta_arrow_schema(self) -> pa.Schema:
+        return self._semantic_converter.from_python_to_arrow_schema(
+            self._get_meta_python_schema()
+        )
+
+    def _select_meta_by_prefix(
+        self, prefixes: Collection[str]
+    ) -> tuple[tuple[str, ...], pa.Schema]:
+        """Return names and schema of the meta columns matching any prefix."""
+        key = frozenset(prefixes)
+        if self._meta_prefix_select_cache is None:
+            self._meta_prefix_select_cache = {}
+        selection = self._meta_prefix_select_cache.get(key)
+        if selection is None:
+            prefixes = tuple(key)
+            fields = [
+                field
+                for field in self._get_meta_arrow_schema()
+                if field.name.startswith(prefixes)
+            ]
+            selection = (tuple(field.name for field in fields), pa.schema(fields))
+            self._meta_prefix_select_cache[key] = selection
+        return selection
+
     def as_table(
         self,
         include_all_info: bool = False,
@@ -413,46 +713,33 @@ class DictDatagram(BaseDatagram):
         include_context = include_all_info or include_context
         include_meta_columns = include_all_info or include_meta_columns
 
-        # Build data table (cached)
-        if self._cached_data_table is None:
-            self._cached_data_table = self._semantic_converter.from_python_to_arrow(
-                self._data,
-                self._data_python_schema,
-            )
-        assert self._cached_data_table is not None, (
-            "Data Arrow table should be initialized by now"
-        )
-        result_table = self._cached_data_table
+        data_table = self._get_data_arrow_table()
+        include_meta = bool(include_meta_columns) and bool(self._meta_data)
+        if not include_context and not include_meta:
+            return data_table
+
+        # Collect all columns first so that the output table is built only once
+        all_arrays = list(data_table.columns)
+        all_fields = list(data_table.schema)
 
         # Add context if requested
         if include_context:
-            result_table = result_table.append_column(
-                constants.CONTEXT_KEY,
-                pa.array([self._data_context.context_key], type=pa.large_string()),
-            )
+            context_array = self._data_context.context_key_arrow_array
+            all_arrays.append(context_array)
+            all_fields.append(pa.field(constants.CONTEXT_KEY, context_array.type))
 
         # Add meta columns if requested
-        meta_table = None
-        if include_meta_columns and self._meta_data:
+        if include_meta:
             meta_table = self._get_meta_arrow_table()
             # Select appropriate meta columns
             if isinstance(include_meta_columns, Collection):
                 # Filter meta columns by prefix matching
-                matched_cols = [
-                    col
-                    for col in self._meta_data.keys()
-                    if any(col.startswith(prefix) for prefix in include_meta_columns)
-                ]
-                if matched_cols:
-                    meta_table = meta_table.select(matched_cols)
-                else:
-                    meta_table = None
-
-            # Combine tables if we have meta columns to add
-            if meta_table is not None:
-                result_table = arrow_utils.hstack_tables(result_table, meta_table)
+                matched_cols, _ = self._select_meta_by_prefix(include_meta_columns)
+                meta_table = meta_table.select(matched_cols)
+            all_arrays.extend(meta_table.columns)
+            all_fields.extend(meta_table.schema)
 
-        return result_table
+        return pa.Table.from_arrays(all_arrays, schema=pa.schema(all_fields))
 
     # 5. Meta Column Operations
     def get_meta_value(self, key: str, default: DataValue = None) -> DataValue:
@@ -491,17 +778,16 @@ class DictDatagram(BaseDatagram):
             prefixed_updates[k] = v
 
         # Start with existing meta data
-        new_meta_data = dict(self._meta_data)
-        new_meta_data.update(prefixed_updates)
+        new_meta_data = self._meta_data | prefixed_updates
 
-        # Reconstruct full data dict for new instance
-        full_data = dict(self._data)  # User data
-        full_data.update(new_meta_data)  # Meta data
-
-        return self.__class__(
-            data=full_data,
-            semantic_converter=self._semantic_converter,
-            data_context=self._data_context,
+        return self._share_data_caches(
+            self._from_split(
+                self._data,
+                new_meta_data,
+                semantic_converter=self._semantic_converter,
+                data_context=self._data_context,
+                data_python_schema=self._data_python_schema,
+            )
         )
 
     def drop_meta_columns(self, *keys: str, ignore_missing: bool = False) -> Self:
@@ -526,7 +812,7 @@ class DictDatagram(BaseDatagram):
                 key = constants.META_PREFIX + key
             prefixed_keys.add(key)
 
-        missing_keys = prefixed_keys - set(self._meta_data.keys())
+        missing_keys = prefixed_keys.difference(self._meta_data)
         if missing_keys and not ignore_missing:
             raise KeyError(
                 f"Following meta columns do not exist and cannot be dropped: {sorted(missing_keys)}"
@@ -537,14 +823,14 @@ class DictDatagram(BaseDatagram):
             k: v for k, v in self._meta_data.items() if k not in prefixed_keys
         }
 
-        # Reconstruct full data dict for new instance
-        full_data = dict(self._data)  # User data
-        full_data.update(new_meta_data)  # Filtered meta data
-
-        return self.__class__(
-            data=full_data,
-            semantic_converter=self._semantic_converter,
-            data_context=self._data_context,
+        return self._share_data_caches(
+            self._from_split(
+                self._data,
+                new_meta_data,
+                semantic_converter=self._semantic_converter,
+                data_context=self._data_context,
+                data_python_schema=self._data_python_schema,
+            )
         )
 
     # 6. Data Column Operations
@@ -560,19 +846,16 @@ class DictDatagram(BaseDatagram):
             New DictDatagram instance with only specified data columns
         """
         # Validate columns exist
-        missing_cols = set(column_names) - set(self._data.keys())
+        missing_cols = set(column_names).difference(self._data)
         if missing_cols:
             raise KeyError(f"Columns not found: {missing_cols}")
 
         # Keep only specified data columns
         new_data = {k: v for k, v in self._data.items() if k in column_names}
 
-        # Reconstruct full data dict for new instance
-        full_data = new_data  # Selected user data
-        full_data.update(self._meta_data)  # Keep existing meta data
-
-        return self.__class__(
-            data=full_data,
+        return self._from_split(
+            new_data,
+            self._meta_data,  # Keep existing meta data
             semantic_converter=self._semantic_converter,
             data_context=self._data_context,
         )
@@ -589,7 +872,7 @@ class DictDatagram(BaseDatagram):
             New DictDatagram instance without specified data columns
         """
         # Filter out specified data columns
-        missing = set(column_names) - set(self._data.keys())
+        missing = set(column_names).difference(self._data)
         if missing and not ignore_missing:
             raise KeyError(
                 f"Following columns do not exist and cannot be dropped: {sorted(missing)}"
@@ -600,12 +883,9 @@ class DictDatagram(BaseDatagram):
         if not new_data:
             raise ValueError("Cannot drop all data columns")
 
-        # Reconstruct full data dict for new instance
-        full_data = new_data  # Filtered user data
-        full_data.update(self._meta_data)  # Keep existing meta data
-
-        return self.__class__(
-            data=full_data,
+        return self._from_split(
+            new_data,
+            self._meta_data,  # Keep existing meta data
             semantic_converter=self._semantic_converter,
             data_context=self._data_context,
         )
@@ -621,31 +901,22 @@ class DictDatagram(BaseDatagram):
         Returns:
             New DictDatagram instance with renamed data columns
         """
+        # Nothing to rename - the datagram is immutable so it can be returned as is
+        overlap = column_mapping.keys() & self._data.keys()
+        if not overlap:
+            return self
+
         # Rename data columns according to mapping, preserving original types
         new_data = {}
+        new_typespec = {}
         for old_name, value in self._data.items():
-            new_name = column_mapping.get(old_name, old_name)
+            new_name = column_mapping[old_name] if old_name in overlap else old_name
             new_data[new_name] = value
+            new_typespec[new_name] = self._data_python_schema[old_name]
 
-        # Handle typespec updates for renamed columns
-        new_typespec = None
-        if self._data_python_schema:
-            existing_typespec = dict(self._data_python_schema)
-
-            # Rename types according to column mapping
-            renamed_typespec = {}
-            for old_name, old_type in existing_typespec.items():
-                new_name = column_mapping.get(old_name, old_name)
-                renamed_typespec[new_name] = old_type
-
-            new_typespec = renamed_typespec
-
-        # Reconstruct full data dict for new instance
-        full_data = new_data  # Renamed user data
-        full_data.update(self._meta_data)  # Keep existing meta data
-
-        return self.__class__(
-            data=full_data,
+        return self._from_split(
+            new_data,
+            self._meta_data,  # Keep existing meta data
             typespec=new_typespec,
             semantic_converter=self._semantic_converter,
             data_context=self._data_context,
@@ -669,7 +940,7 @@ class DictDatagram(BaseDatagram):
             return self
 
         # Error if any column doesn't exist
-        missing_columns = set(updates.keys()) - set(self._data.keys())
+        missing_columns = updates.keys() - self._data.keys()
         if missing_columns:
             raise KeyError(
                 f"Columns not found: {sorted(missing_columns)}. "
@@ -677,15 +948,11 @@ class DictDatagram(BaseDatagram):
             )
 
         # Update existing columns
-        new_data = dict(self._data)
-        new_data.update(updates)
-
-        # Reconstruct full data dict for new instance
-        full_data = new_data  # Updated user data
-        full_data.update(self._meta_data)  # Keep existing meta data
+        new_data = self._data | updates
 
-        return self.__class__(
-            data=full_data,
+        return self._from_split(
+            new_data,
+            self._meta_data,  # Keep existing meta data
             semantic_converter=self._semantic_converter,  # Keep existing converter
             data_context=self._data_context,
         )
@@ -716,7 +983,7 @@ class DictDatagram(BaseDatagram):
             return self
 
         # Error if any column already exists
-        existing_overlaps = set(updates.keys()) & set(self._data.keys())
+        existing_overlaps = updates.keys() & self._data.keys()
         if existing_overlaps:
             raise ValueError(
                 f"Columns already exist: {sorted(existing_overlaps)}. "
@@ -724,25 +991,21 @@ class DictDatagram(BaseDatagram):
             )
 
         # Update user data with new columns
-        new_data = dict(self._data)
-        new_data.update(updates)
+        new_data = self._data | updates
 
         # Create updated typespec - handle None values by defaulting to str
-        typespec = self.types()
+        typespec: TypeSpec = self._data_python_schema
         if column_types is not None:
-            typespec.update(column_types)
+            typespec = {**self._data_python_schema, **column_types}
 
         new_typespec = tsutils.get_typespec_from_dict(
             new_data,
             typespec=typespec,
         )
 
-        # Reconstruct full data dict for new instance
-        full_data = new_data  # Updated user data
-        full_data.update(self._meta_data)  # Keep existing meta data
-
-        return self.__class__(
-            data=full_data,
+        return self._from_split(
+            new_data,
+            self._meta_data,  # Keep existing meta data
             typespec=new_typespec,
             # semantic converter needs to be rebuilt for new columns
             data_context=self._data_context,
@@ -760,14 +1023,12 @@ class DictDatagram(BaseDatagram):
         Returns:
             New DictDatagram instance with new context
         """
-        # Reconstruct full data dict for new instance
-        full_data = dict(self._data)  # User data
-        full_data.update(self._meta_data)  # Meta data
-
-        return self.__class__(
-            data=full_data,
+        return self._from_split(
+            self._data,
+            self._meta_data,
             data_context=new_context_key,  # New context
             # Note: semantic_converter will be rebuilt for new context
+            data_python_schema=self._data_python_schema,
         )
 
     # 8. Utility Operations
@@ -783,11 +1044,14 @@ class DictDatagram(BaseDatagram):
             New DictDatagram instance with copied data and caches.
         """
         new_datagram = super().copy()
-        new_datagram._data = self._data.copy()
-        new_datagram._meta_data = self._meta_data.copy()
-        new_datagram._data_python_schema = self._data_python_schema.copy()
+        # Datagrams never mutate their columns in place, so the underlying
+        # dictionaries and schema are shared rather than copied
+        new_datagram._data = self._data
+        new_datagram._meta_data = self._meta_data
+        new_datagram._meta_columns = self._meta_columns
+        new_datagram._data_python_schema = self._data_python_schema
         new_datagram._semantic_converter = self._semantic_converter
-        new_datagram._meta_python_schema = self._meta_python_schema.copy()
+        new_datagram._meta_typespec = self._meta_typespec
 
         if include_cache:
             new_datagram._cached_data_table = self._cached_data_table
@@ -795,12 +1059,16 @@ class DictDatagram(BaseDatagram):
             new_datagram._cached_content_hash = self._cached_content_hash
             new_datagram._cached_data_arrow_schema = self._cached_data_arrow_schema
             new_datagram._cached_meta_arrow_schema = self._cached_meta_arrow_schema
+            new_datagram._cached_meta_python_schema = self._cached_meta_python_schema
+            new_datagram._meta_prefix_select_cache = self._meta_prefix_select_cache
         else:
             new_datagram._cached_data_table = None
             new_datagram._cached_meta_table = None
             new_datagram._cached_content_hash = None
             new_datagram._cached_data_arrow_schema = None
             new_datagram._cached_meta_arrow_schema = None
+            new_datagram._cached_meta_python_schema = None
+            new_datagram._meta_prefix_select_cache = None
 
         return new_datagram
 
@@ -827,11 +1095,11 @@ class DictDatagram(BaseDatagram):
         Returns:
             Detailed representation with type and metadata information.
         """
-        meta_count = len(self.meta_columns)
+        meta_count = len(self._meta_columns)
         context_key = self.data_context_key
 
         return (
-            f"{self.__class__.__name__}("
+            f"{self._cls_name}("
             f"data={self._data}, "
             f"meta_columns={meta_count}, "
             f"context='{context_key}'"
@@ -1,6 +1,6 @@
 import logging
 from collections.abc import Collection, Mapping
-from typing import Self
+from typing import Any, Self
 from xml.etree.ElementInclude import include
 
 import pyarrow as pa
@@ -54,14 +54,7 @@ class DictPacket(DictDatagram):
         data_context: str | DataContext | None = None,
     ) -> None:
         # normalize the data content and remove any source info keys
-        data_only = {
-            k: v for k, v in data.items() if not k.startswith(constants.SOURCE_PREFIX)
-        }
-        contained_source_info = {
-            k.removeprefix(constants.SOURCE_PREFIX): v
-            for k, v in data.items()
-            if k.startswith(constants.SOURCE_PREFIX)
-        }
+        data_only, contained_source_info = self._split_source_info(data)
 
         super().__init__(
             data_only,
@@ -75,6 +68,51 @@ class DictPacket(DictDatagram):
         self._cached_source_info_table: pa.Table | None = None
         self._cached_source_info_schema: pa.Schema | None = None
 
+    @staticmethod
+    def _split_source_info(
+        data: Mapping[str, DataValue],
+    ) -> tuple[dict[str, DataValue], dict[str, str | None]]:
+        """Separate source info columns from the rest of the data."""
+        data_only = {
+            k: v for k, v in data.items() if not k.startswith(constants.SOURCE_PREFIX)
+        }
+        contained_source_info = {
+            k.removeprefix(constants.SOURCE_PREFIX): v
+            for k, v in data.items()
+            if k.startswith(constants.SOURCE_PREFIX)
+        }
+        return data_only, contained_source_info
+
+    @classmethod
+    def _split_record(
+        cls,
+        record: Mapping[str, DataValue],
+        data_context: str | DataContext | None,
+    ) -> tuple[
+        dict[str, DataValue],
+        dict[str, DataValue],
+        str | DataContext | None,
+        dict[str, Any],
+    ]:
+        data_only, source_info = cls._split_source_info(record)
+        data, meta, context, extra = super()._split_record(data_only, data_context)
+        return data, meta, context, {**extra, "source_info": source_info}
+
+    @classmethod
+    def _from_split(
+        cls,
+        data: dict[str, DataValue],
+        meta: dict[str, DataValue],
+        *,
+        source_info: Mapping[str, str | None] | None = None,
+        **kwargs,
+    ) -> Self:
+        instance = super()._from_split(data, meta, **kwargs)
+        instance._source_info = dict(source_info or {})
+        instance._cached_source_info_table = None
+        instance._cached_source_info_schema = None
+        return instance
+
     @property
     def _source_info_schema(self) -> pa.Schema:
         if self._cached_source_info_schema is None:
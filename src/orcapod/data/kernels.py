@@ -1,9 +1,13 @@
-from abc import ABC, abstractmethod
-from collections.abc import Collection
+from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Collection
 from datetime import datetime, timezone
+from functools import cached_property
 from typing import Any
 from orcapod.protocols import data_protocols as dp
 import logging
+import time
+import weakref
 from orcapod.data.streams import KernelStream
 from orcapod.data.base import LabeledContentIdentifiableBase
 from orcapod.data.context import DataContext
@@ -13,7 +17,45 @@ from orcapod.types import TypeSpec
 logger = logging.getLogger(__name__)
 
 
-class TrackedKernelBase(ABC, LabeledContentIdentifiableBase):
+def _skip_invocation_tracking(*streams: dp.Stream, label: str | None = None) -> None:
+    """Replaces `track_invocation` on kernels created with `skip_tracking=True`."""
+
+
+def _evict_prepared_on_collect(
+    kernel_ref: "weakref.ref[TrackedKernelBase]", key: tuple[int, ...]
+) -> Callable[[weakref.ref], None]:
+    """
+    Weakref callback dropping the kernel's cached entry for `key` once one of the
+    streams it was derived from is collected, before its id can be reused.
+    """
+
+    def evict(_: weakref.ref) -> None:
+        kernel = kernel_ref()
+        if kernel is not None:
+            kernel._evict_prepared(key)
+
+    return evict
+
+
+def _abstract_methods_of(cls: type) -> frozenset[str]:
+    """
+    Collect the names of methods of `cls` that are still marked abstract, following
+    the same rules as ABCMeta. Assigning the result to `cls.__abstractmethods__`
+    makes the interpreter refuse to instantiate the class while it is non-empty.
+    """
+    abstracts = {
+        name
+        for name, value in vars(cls).items()
+        if getattr(value, "__isabstractmethod__", False)
+    }
+    for base in cls.__bases__:
+        for name in getattr(base, "__abstractmethods__", ()):
+            if getattr(getattr(cls, name, None), "__isabstractmethod__", False):
+                abstracts.add(name)
+    return frozenset(abstracts)
+
+
+class TrackedKernelBase(LabeledContentIdentifiableBase):
     """
     Kernel defines the fundamental unit of computation that can be performed on zero, one or more streams of data.
     It is the base class for all computations and transformations that can be performed on a collection of streams
@@ -25,38 +67,84 @@ class TrackedKernelBase(ABC, LabeledContentIdentifiableBase):
     for computational graph tracking.
     """
 
+    # number of most recent input stream combinations whose pre-processed
+    # and validated form is kept by the kernel
+    _PREPARED_CACHE_SIZE = 8
+
+    # number of input streams taken by the kernel, or None if not fixed. Kernels
+    # with a fixed arity may take their streams as positional parameters in
+    # forward and kernel_output_types instead of packing them into a tuple.
+    _ARITY: int | None = None
+
+    # whether output types and identity may depend on the input streams. Kernels
+    # setting this to False skip stream pre-processing and validation when
+    # invoked without streams
+    _TYPES_DEPEND_ON_STREAMS: bool = True
+
+    # class name used in messages and representations, kept up to date for subclasses
+    _cls_name = "TrackedKernelBase"
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        # Abstract methods are tracked without ABCMeta, sparing kernel classes
+        # the metaclass overhead on isinstance and subclass checks
+        super().__init_subclass__(**kwargs)
+        cls.__abstractmethods__ = _abstract_methods_of(cls)
+        cls._cls_name = cls.__name__
+
     def __init__(
         self,
         label: str | None = None,
         data_context: str | DataContext | None = None,
         skip_tracking: bool = False,
         tracker_manager: dp.TrackerManager | None = None,
+        use_fast_identity: bool = False,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
         self._label = label
 
         self._data_context = DataContext.resolve_data_context(data_context)
+        self._data_context_key = self._data_context.context_key
 
         self._skip_tracking = skip_tracking
         self._tracker_manager = tracker_manager or DEFAULT_TRACKER_MANAGER
+        if skip_tracking:
+            # swap out tracking once rather than checking on every invocation
+            self.track_invocation = _skip_invocation_tracking
         self._last_modified = None
-        self._kernel_hash = None
-        self._set_modified_time()
-
-    @property
+        # creation time is captured as a raw timestamp and only turned into a
+        # datetime when last_modified is first read
+        self._pending_modified_time: float | None = time.time()
+        # kernel_id may opt into a fast non-cryptographic hash where it is only
+        # used within a session; it defaults to the object hasher as kernel_id
+        # also ends up in persisted values such as source info and pipeline paths
+        self._use_fast_identity = use_fast_identity
+        # recently validated streams, held weakly so that the kernel does not keep
+        # its inputs (and their upstream graphs) alive
+        self._prepared_cache: OrderedDict[
+            tuple[int, ...], tuple[weakref.ref[dp.Stream], ...]
+        ] = OrderedDict()
+        # output types, kept for the streams in _prepared_cache
+        self._output_types_cache: dict[tuple[int, ...], tuple[TypeSpec, TypeSpec]] = {}
+
+    @cached_property
     def kernel_id(self) -> tuple[str, ...]:
         """
         Returns a unique identifier for the kernel.
         This is used to identify the kernel in the computational graph.
+        The identifier is computed on first access and stored on the instance.
         """
-        if self._kernel_hash is None:
-            # If the kernel hash is not set, compute it based on the class name and label.
-            # This is a simple way to ensure that each kernel has a unique identifier.
-            self._kernel_hash = self.data_context.object_hasher.hash_to_hex(
+        # Compute the kernel hash based on the class name and identity structure.
+        # This is a simple way to ensure that each kernel has a unique identifier.
+        if self._use_fast_identity:
+            kernel_hash = self.data_context.fast_identity_hash(
+                self.identity_structure()
+            )
+        else:
+            kernel_hash = self.data_context.object_hasher.hash_to_hex(
                 self.identity_structure(), prefix_hasher_id=True
             )
-        return (f"{self.__class__.__name__}", self._kernel_hash)
+        return (self._cls_name, kernel_hash)
 
     @property
     def data_context(self) -> DataContext:
@@ -65,7 +153,7 @@ class TrackedKernelBase(ABC, LabeledContentIdentifiableBase):
     @property
     def data_context_key(self) -> str:
         """Return the data context key."""
-        return self._data_context.context_key
+        return self._data_context_key
 
     @property
     def last_modified(self) -> datetime | None:
@@ -73,6 +161,11 @@ class TrackedKernelBase(ABC, LabeledContentIdentifiableBase):
         When the kernel was last modified. For most kernels, this is the timestamp
         of the kernel creation.
         """
+        if self._pending_modified_time is not None:
+            self._last_modified = datetime.fromtimestamp(
+                self._pending_modified_time, timezone.utc
+            )
+            self._pending_modified_time = None
         return self._last_modified
 
     def _set_modified_time(
@@ -83,8 +176,13 @@ class TrackedKernelBase(ABC, LabeledContentIdentifiableBase):
         If `invalidate` is True, it resets the last modified time to None to indicate unstable state that'd signal downstream
         to recompute when using the kernel. Othewrise, sets the last modified time to the current time or to the provided timestamp.
         """
+        self._pending_modified_time = None
         if invalidate:
             self._last_modified = None
+            # identity may have changed along with the kernel
+            self.__dict__.pop("kernel_id", None)
+            self._prepared_cache.clear()
+            self._output_types_cache.clear()
             return
 
         if timestamp is not None:
@@ -100,9 +198,17 @@ class TrackedKernelBase(ABC, LabeledContentIdentifiableBase):
         ...
 
     def output_types(self, *streams: dp.Stream) -> tuple[TypeSpec, TypeSpec]:
-        processed_streams = self.pre_kernel_processing(*streams)
-        self.validate_inputs(*processed_streams)
-        return self.kernel_output_types(*processed_streams)
+        if not streams and not self._TYPES_DEPEND_ON_STREAMS:
+            return self.kernel_output_types()
+        processed_streams, key = self._prepared(streams)
+        output_types = self._output_types_cache.get(key)
+        if output_types is None:
+            output_types = self.kernel_output_types(*processed_streams)
+            if key in self._prepared_cache:
+                self._output_types_cache[key] = output_types
+        # hand out copies so that callers cannot alter the cached types
+        tag_types, packet_types = output_types
+        return dict(tag_types), dict(packet_types)
 
     @abstractmethod
     def kernel_identity_structure(
@@ -124,10 +230,13 @@ class TrackedKernelBase(ABC, LabeledContentIdentifiableBase):
         # and therefore kernel K(x, y) == K(y, x), then the identity structure must reflect the
         # equivalence of the two by returning the same identity structure for both invocations.
         # This can be achieved, for example, by returning a set over the streams instead of a tuple.
-        if streams is not None:
-            streams = self.pre_kernel_processing(*streams)
-            self.validate_inputs(*streams)
-        return self.kernel_identity_structure(streams)
+        if streams is None:
+            return self.kernel_identity_structure(None)
+        if not streams and not self._TYPES_DEPEND_ON_STREAMS:
+            return self.kernel_identity_structure(streams)
+
+        processed_streams, _ = self._prepared(tuple(streams))
+        return self.kernel_identity_structure(processed_streams)
 
     @abstractmethod
     def forward(self, *streams: dp.Stream) -> dp.Stream:
@@ -137,6 +246,36 @@ class TrackedKernelBase(ABC, LabeledContentIdentifiableBase):
         Subclasses should override this method to provide the kernel with its unique behavior
         """
 
+    def _prepared(
+        self, streams: tuple[dp.Stream, ...]
+    ) -> tuple[tuple[dp.Stream, ...], tuple[int, ...]]:
+        """
+        Run pre-kernel processing on the streams and validate the processed streams,
+        returning them along with the cache key derived from them. Pre-processing may
+        invoke other (tracked) kernels and therefore always runs; only validation is
+        skipped when the same processed streams were recently validated by this kernel.
+        Cached entries reference the processed streams weakly and are dropped as soon
+        as any of them is collected, so ids used in the key are never stale.
+        """
+        processed_streams = tuple(self.pre_kernel_processing(*streams))
+        key = tuple(map(id, processed_streams))
+        if key in self._prepared_cache:
+            self._prepared_cache.move_to_end(key)
+            return processed_streams, key
+
+        self.validate_inputs(*processed_streams)
+        evict = _evict_prepared_on_collect(weakref.ref(self), key)
+        self._prepared_cache[key] = tuple(
+            weakref.ref(stream, evict) for stream in processed_streams
+        )
+        if len(self._prepared_cache) > self._PREPARED_CACHE_SIZE:
+            self._evict_prepared(next(iter(self._prepared_cache)))
+        return processed_streams, key
+
+    def _evict_prepared(self, key: tuple[int, ...]) -> None:
+        self._prepared_cache.pop(key, None)
+        self._output_types_cache.pop(key, None)
+
     def pre_kernel_processing(self, *streams: dp.Stream) -> tuple[dp.Stream, ...]:
         """
         Pre-processing step that can be overridden by subclasses to perform any necessary pre-processing
@@ -168,26 +307,28 @@ class TrackedKernelBase(ABC, LabeledContentIdentifiableBase):
         """
         Track the invocation of the kernel with the provided streams.
         This is a convenience method that calls record_kernel_invocation.
+        Kernels created with `skip_tracking=True` replace this method with a no-op.
         """
-        if not self._skip_tracking and self._tracker_manager is not None:
-            self._tracker_manager.record_kernel_invocation(self, streams, label=label)
+        self._tracker_manager.record_kernel_invocation(self, streams, label=label)
 
     def __call__(
         self, *streams: dp.Stream, label: str | None = None, **kwargs
     ) -> KernelStream:
-        processed_streams = self.pre_kernel_processing(*streams)
-        self.validate_inputs(*processed_streams)
+        processed_streams, _ = self._prepared(streams)
         output_stream = self.prepare_output_stream(*processed_streams, label=label)
         self.track_invocation(*processed_streams, label=label)
         return output_stream
 
     def __repr__(self):
-        return self.__class__.__name__
+        return self._cls_name
 
     def __str__(self):
         if self._label is not None:
-            return f"{self.__class__.__name__}({self._label})"
-        return self.__class__.__name__
+            return f"{self._cls_name}({self._label})"
+        return self._cls_name
+
+
+TrackedKernelBase.__abstractmethods__ = _abstract_methods_of(TrackedKernelBase)
 
 
 class WrappedKernel(TrackedKernelBase):
@@ -205,6 +346,7 @@ class WrappedKernel(TrackedKernelBase):
         # TODO: handle fixed input stream already set on the kernel
         super().__init__(**kwargs)
         self.kernel = kernel
+        self._wraps_tracked = isinstance(kernel, TrackedKernelBase)
 
     def computed_label(self) -> str | None:
         """
@@ -219,6 +361,10 @@ class WrappedKernel(TrackedKernelBase):
         return self.kernel.kernel_id
 
     def kernel_output_types(self, *streams: dp.Stream) -> tuple[TypeSpec, TypeSpec]:
+        if self._wraps_tracked:
+            # streams were already validated by the wrapped kernel in validate_inputs,
+            # just as forward passes them straight to the wrapped kernel
+            return self.kernel.kernel_output_types(*streams)
         return self.kernel.output_types(*streams)
 
     def kernel_identity_structure(
@@ -21,6 +21,9 @@ class UnaryOperator(Operator):
     Base class for all operators.
     """
 
+    _ARITY = 1
+    _ARITY_ERR = "UnaryOperator requires exactly one input stream."
+
     def check_unary_input(
         self,
         streams: Collection[dp.Stream],
@@ -28,24 +31,22 @@ class UnaryOperator(Operator):
         """
         Check that the inputs to the unary operator are valid.
         """
-        if len(streams) != 1:
-            raise ValueError("UnaryOperator requires exactly one input stream.")
+        if len(streams) != self._ARITY:
+            raise ValueError(self._ARITY_ERR)
 
     def validate_inputs(self, *streams: dp.Stream) -> None:
         self.check_unary_input(streams)
         stream = streams[0]
         return self.op_validate_inputs(stream)
 
-    def forward(self, *streams: dp.Stream) -> dp.Stream:
+    def forward(self, stream: dp.Stream, /) -> dp.Stream:
         """
         Forward method for unary operators.
         It expects exactly one stream as input.
         """
-        stream = streams[0]
         return self.op_forward(stream)
 
-    def kernel_output_types(self, *streams: dp.Stream) -> tuple[TypeSpec, TypeSpec]:
-        stream = streams[0]
+    def kernel_output_types(self, stream: dp.Stream, /) -> tuple[TypeSpec, TypeSpec]:
         return self.op_output_types(stream)
 
     def kernel_identity_structure(
@@ -56,8 +57,8 @@ class UnaryOperator(Operator):
         This is used to ensure that the operator can be uniquely identified in the computational graph.
         """
         if streams is not None:
-            stream = list(streams)[0]
-            self.op_identity_structure(stream)
+            (stream,) = streams
+            return self.op_identity_structure(stream)
         return self.op_identity_structure()
 
     @abstractmethod
@@ -98,6 +99,9 @@ class BinaryOperator(Operator):
     Base class for all operators.
     """
 
+    _ARITY = 2
+    _ARITY_ERR = "BinaryOperator requires exactly two input streams."
+
     def check_binary_inputs(
         self,
         streams: Collection[dp.Stream],
@@ -106,24 +110,24 @@ class BinaryOperator(Operator):
         Check that the inputs to the binary operator are valid.
         This method is called before the forward method to ensure that the inputs are valid.
         """
-        if len(streams) != 2:
-            raise ValueError("BinaryOperator requires exactly two input streams.")
+        if len(streams) != self._ARITY:
+            raise ValueError(self._ARITY_ERR)
 
     def validate_inputs(self, *streams: dp.Stream) -> None:
         self.check_binary_inputs(streams)
         left_stream, right_stream = streams
         return self.op_validate_inputs(left_stream, right_stream)
 
-    def forward(self, *streams: dp.Stream) -> dp.Stream:
+    def forward(self, left_stream: dp.Stream, right_stream: dp.Stream, /) -> dp.Stream:
         """
         Forward method for binary operators.
         It expects exactly two streams as input.
         """
-        left_stream, right_stream = streams
         return self.op_forward(left_stream, right_stream)
 
-    def kernel_output_types(self, *streams: dp.Stream) -> tuple[TypeSpec, TypeSpec]:
-        left_stream, right_stream = streams
+    def kernel_output_types(
+        self, left_stream: dp.Stream, right_stream: dp.Stream, /
+    ) -> tuple[TypeSpec, TypeSpec]:
         return self.op_output_types(left_stream, right_stream)
 
     def kernel_identity_structure(
@@ -135,7 +139,7 @@ class BinaryOperator(Operator):
         """
         if streams is not None:
             left_stream, right_stream = streams
-            self.op_identity_structure(left_stream, right_stream)
+            return self.op_identity_structure(left_stream, right_stream)
         return self.op_identity_structure()
 
     @abstractmethod
@@ -196,7 +200,7 @@ class NonZeroInputOperator(Operator):
         """
         if len(streams) == 0:
             raise ValueError(
-                f"Operator {self.__class__.__name__} requires at least one input stream."
+                f"Operator {self._cls_name} requires at least one input stream."
             )
 
     def validate_inputs(self, *streams: dp.Stream) -> None:
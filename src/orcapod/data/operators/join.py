@@ -101,7 +101,9 @@ class Join(NonZeroInputOperator):
         self, streams: Collection[dp.Stream] | None = None
     ) -> Any:
         return (
-            (self.__class__.__name__,) + (set(streams),) if streams is not None else ()
+            (self.__class__.__name__,) + (self.data_context.intern_streamset(streams),)
+            if streams is not None
+            else ()
         )
 
     def __repr__(self) -> str:
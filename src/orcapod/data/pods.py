@@ -158,8 +158,7 @@ class ActivatablePodBase(TrackedKernelBase):
     ) -> tuple[dp.Tag, dp.Packet | None]: ...
 
     def track_invocation(self, *streams: dp.Stream, label: str | None = None) -> None:
-        if not self._skip_tracking and self._tracker_manager is not None:
-            self._tracker_manager.record_pod_invocation(self, streams, label=label)
+        self._tracker_manager.record_pod_invocation(self, streams, label=label)
 
 
 def function_pod(
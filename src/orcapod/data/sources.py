@@ -45,6 +45,9 @@ class SourceBase(TrackedKernelBase, OperatorStreamBaseMixin):
     are identical and both benefit from KernelStream's lifecycle management.
     """
 
+    # Sources take no input streams
+    _TYPES_DEPEND_ON_STREAMS = False
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Cache the KernelStream for reuse across all stream method calls
@@ -91,8 +94,7 @@ class SourceBase(TrackedKernelBase, OperatorStreamBaseMixin):
         return self._cached_kernel_stream
 
     def track_invocation(self, *streams: dp.Stream, label: str | None = None) -> None:
-        if not self._skip_tracking and self._tracker_manager is not None:
-            self._tracker_manager.record_source_invocation(self, label=label)
+        self._tracker_manager.record_source_invocation(self, label=label)
 
     # ==================== Stream Protocol (Delegation) ====================
 
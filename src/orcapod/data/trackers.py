@@ -18,6 +18,12 @@ class BasicTrackerManager:
     def __init__(self) -> None:
         self._active_trackers: list[dp.Tracker] = []
         self._active = True
+        # invocations recorded while a batch is open, as (trackers active at the
+        # time, method name, args, label)
+        self._batch: (
+            list[tuple[list[dp.Tracker], str, tuple[Any, ...], str | None]] | None
+        ) = None
+        self._batch_depth = 0
 
     def set_active(self, active: bool = True) -> None:
         """
@@ -40,6 +46,9 @@ class BasicTrackerManager:
         This is used to deactivate a tracker and remove it from the list of active trackers.
         """
         if tracker in self._active_trackers:
+            if self._batch:
+                # hand over what the tracker witnessed before it stops tracking
+                self._flush_batch_for(tracker)
             self._active_trackers.remove(tracker)
 
     def get_active_trackers(self) -> list[dp.Tracker]:
@@ -63,7 +72,14 @@ class BasicTrackerManager:
         Record the output stream of a kernel invocation in the tracker.
         This is used to track the computational graph and the invocations of kernels.
         """
-        for tracker in self.get_active_trackers():
+        trackers = self.get_active_trackers()
+        if self._batch is not None:
+            if trackers:
+                self._batch.append(
+                    (trackers, "record_kernel_invocation", (kernel, upstreams), label)
+                )
+            return
+        for tracker in trackers:
             tracker.record_kernel_invocation(kernel, upstreams, label=label)
 
     def record_source_invocation(
@@ -73,7 +89,14 @@ class BasicTrackerManager:
         Record the output stream of a source invocation in the tracker.
         This is used to track the computational graph and the invocations of sources.
         """
-        for tracker in self.get_active_trackers():
+        trackers = self.get_active_trackers()
+        if self._batch is not None:
+            if trackers:
+                self._batch.append(
+                    (trackers, "record_source_invocation", (source,), label)
+                )
+            return
+        for tracker in trackers:
             tracker.record_source_invocation(source, label=label)
 
     def record_pod_invocation(
@@ -83,9 +106,62 @@ class BasicTrackerManager:
         Record the output stream of a pod invocation in the tracker.
         This is used to track the computational graph and the invocations of pods.
         """
-        for tracker in self.get_active_trackers():
+        trackers = self.get_active_trackers()
+        if self._batch is not None:
+            if trackers:
+                self._batch.append(
+                    (trackers, "record_pod_invocation", (pod, upstreams), label)
+                )
+            return
+        for tracker in trackers:
             tracker.record_pod_invocation(pod, upstreams, label=label)
 
+    def _flush_batch_for(self, tracker: dp.Tracker) -> None:
+        """Record the buffered invocations witnessed by `tracker` in it right away."""
+        for trackers, method_name, args, label in self._batch or []:
+            if tracker in trackers:
+                trackers.remove(tracker)
+                getattr(tracker, method_name)(*args, label=label)
+
+    def begin_batch(self) -> None:
+        """
+        Start collecting invocations instead of recording them right away.
+        Batches may be nested; invocations are recorded when the outermost
+        batch ends.
+        """
+        if self._batch_depth == 0:
+            self._batch = []
+        self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        """
+        End the current batch. When the outermost batch ends, all collected
+        invocations are recorded, in order, in the trackers that were active when
+        each invocation was made. Trackers deregistered during the batch have
+        already received their invocations.
+        """
+        if self._batch_depth == 0:
+            raise RuntimeError("end_batch called without a matching begin_batch")
+        self._batch_depth -= 1
+        if self._batch_depth > 0:
+            return
+        batch, self._batch = self._batch or [], None
+        for trackers, method_name, args, label in batch:
+            for tracker in trackers:
+                getattr(tracker, method_name)(*args, label=label)
+
+    @contextmanager
+    def batch(self) -> Generator[None, Any, None]:
+        """
+        Collect invocations made within the context and record them together
+        on exit.
+        """
+        self.begin_batch()
+        try:
+            yield
+        finally:
+            self.end_batch()
+
     @contextmanager
     def no_tracking(self) -> Generator[None, Any, None]:
         original_state = self._active
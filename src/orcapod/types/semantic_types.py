@@ -427,6 +427,7 @@ class SemanticTypeRegistry:
     def __init__(self, semantic_types: Collection[SemanticType] | None = None):
         self._semantic_type_lut: dict[str, SemanticType] = {}
         self._python_to_semantic_lut: dict[type, SemanticType] = {}
+        self._generation = 0
         if semantic_types is not None:
             for semantic_type in semantic_types:
                 self.register_semantic_type(semantic_type)
@@ -450,6 +451,12 @@ class SemanticTypeRegistry:
                 f"Python type {python_type} is already registered for semantic type {self._python_to_semantic_lut[python_type]}"
             )
         self._python_to_semantic_lut[python_type] = semantic_type
+        self._generation += 1
+
+    @property
+    def generation(self) -> int:
+        """Counter incremented on every registration, for keying derived caches"""
+        return self._generation
 
     def get_semantic_type_for_python_type(
         self, python_type: type
@@ -0,0 +1,70 @@
+"""Tests for the identity helpers on DataContext."""
+
+import gc
+
+from orcapod.data.context import DataContext
+from orcapod.data.operators import MapPackets
+from orcapod.data.sources import DictSource
+
+
+class TestFastIdentityHash:
+    def test_is_deterministic(self):
+        context = DataContext.resolve_data_context(None)
+        structure = ("MapPackets", {"a": "b"}, [1, 2.0, None])
+        assert context.fast_identity_hash(structure) == context.fast_identity_hash(
+            ("MapPackets", {"a": "b"}, [1, 2.0, None])
+        )
+        assert context.fast_identity_hash(structure).startswith("xxh3_64@")
+
+    def test_distinguishes_structures(self):
+        context = DataContext.resolve_data_context(None)
+        assert context.fast_identity_hash({"a": "b"}) != context.fast_identity_hash(
+            {"a": "c"}
+        )
+
+    def test_kernel_id_uses_object_hasher_by_default(self):
+        kernel = MapPackets({"v": "w"})
+        expected = kernel.data_context.object_hasher.hash_to_hex(
+            kernel.identity_structure(), prefix_hasher_id=True
+        )
+        assert kernel.kernel_id == ("MapPackets", expected)
+
+    def test_kernel_id_with_fast_identity(self):
+        kernel = MapPackets({"v": "w"}, use_fast_identity=True)
+        assert kernel.kernel_id == (
+            "MapPackets",
+            kernel.data_context.fast_identity_hash(kernel.identity_structure()),
+        )
+        assert (
+            kernel.kernel_id == MapPackets({"v": "w"}, use_fast_identity=True).kernel_id
+        )
+
+
+class TestInternStreamset:
+    def make_sources(self):
+        return (
+            DictSource(tags=[{"id": 1}], packets=[{"v": 1}]),
+            DictSource(tags=[{"id": 1}], packets=[{"w": "a"}]),
+        )
+
+    def test_same_streams_share_the_set(self):
+        context = DataContext.resolve_data_context(None)
+        s1, s2 = self.make_sources()
+        streamset = context.intern_streamset((s1, s2))
+        assert streamset == frozenset((s1, s2))
+        assert context.intern_streamset((s2, s1)) is streamset
+
+    def test_other_streams_get_another_set(self):
+        context = DataContext.resolve_data_context(None)
+        s1, s2 = self.make_sources()
+        assert context.intern_streamset((s1,)) is not context.intern_streamset((s1, s2))
+
+    def test_set_is_released_when_unreferenced(self):
+        context = DataContext.resolve_data_context(None)
+        s1, s2 = self.make_sources()
+        streamset = context.intern_streamset((s1, s2))
+        key = frozenset((id(s1), id(s2)))
+        assert key in context._streamset_interns
+        del streamset
+        gc.collect()
+        assert key not in context._streamset_interns
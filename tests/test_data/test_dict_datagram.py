@@ -0,0 +1,289 @@
+"""Tests for DictDatagram and the dict backed tag and packet implementations."""
+
+from collections.abc import Mapping
+from enum import StrEnum
+from pathlib import Path
+
+from orcapod.data.context import DataContext
+from orcapod.data.datagrams import DictDatagram, DictPacket
+from orcapod.data.system_constants import orcapod_constants as constants
+from orcapod.types.defaults import SEMANTIC_PATH
+from orcapod.types.semantic_types import SemanticTypeRegistry
+
+
+class TestFromRecords:
+    def test_matches_individual_construction(self):
+        records = [{"a": 1, "b": "x", "__m": 1.0}, {"a": 2, "b": "y", "__m": 2.0}]
+        datagrams = DictDatagram.from_records(records)
+        for datagram, record in zip(datagrams, records):
+            expected = DictDatagram(record)
+            assert datagram.as_dict(include_all_info=True) == expected.as_dict(
+                include_all_info=True
+            )
+            assert dict(datagram.types()) == dict(expected.types())
+            assert datagram.content_hash() == expected.content_hash()
+
+    def test_shares_schema_for_homogeneous_records(self):
+        first, second = DictDatagram.from_records([{"a": 1}, {"a": 2}])
+        assert first._data_python_schema is second._data_python_schema
+
+    def test_value_type_change_is_inferred_per_record(self):
+        first, second = DictDatagram.from_records([{"a": 1}, {"a": 2.5}])
+        assert dict(first.types()) == {"a": int}
+        assert dict(second.types()) == {"a": float}
+        assert second.as_table().to_pylist() == [{"a": 2.5}]
+
+    def test_missing_value_does_not_fix_the_schema(self):
+        _, second = DictDatagram.from_records([{"a": None}, {"a": 5}])
+        assert dict(second.types()) == {"a": int}
+        assert second.as_table().to_pylist() == [{"a": 5}]
+
+    def test_differing_columns(self):
+        first, second = DictDatagram.from_records([{"a": 1}, {"b": "x"}])
+        assert first.keys() == ("a",)
+        assert second.keys() == ("b",)
+
+    def test_typespec_applies_to_all_records(self):
+        datagrams = DictDatagram.from_records(
+            [{"a": None}, {"a": 3}], typespec={"a": int}
+        )
+        assert [dict(d.types()) for d in datagrams] == [{"a": int}, {"a": int}]
+
+    def test_packets_keep_their_own_source_info(self):
+        records = [
+            {"v": 1, "_source_v": "src:1"},
+            {"v": 2.5, "_source_v": "src:2"},
+        ]
+        first, second = DictPacket.from_records(records)
+        assert isinstance(first, DictPacket)
+        assert first.source_info() == {"v": "src:1"}
+        assert second.source_info() == {"v": "src:2"}
+        assert dict(second.types()) == {"v": float}
+        assert second.as_table(include_source=True).column_names == ["v", "_source_v"]
+        for packet, record in zip((first, second), records):
+            assert packet.as_dict(include_source=True) == DictPacket(record).as_dict(
+                include_source=True
+            )
+
+
+class TestColumnNames:
+    def test_str_subclass_keys(self):
+        class Column(StrEnum):
+            VALUE = "value"
+            META = "__meta"
+
+        datagram = DictDatagram({Column.VALUE: 1, Column.META: "m"})
+        assert datagram.keys() == ("value",)
+        assert datagram["value"] == 1
+        assert datagram.meta_columns == ("__meta",)
+        assert datagram.get_meta_value("meta") == "m"
+
+
+class TestMetaColumnSelection:
+    def make_datagram(self):
+        return DictDatagram({"a": 1, "__pod_id": "p", "__pod_ts": 2.0, "__other": 3})
+
+    def test_keys_by_prefix(self):
+        datagram = self.make_datagram()
+        assert datagram.keys(include_meta_columns=["__pod"]) == (
+            "a",
+            "__pod_id",
+            "__pod_ts",
+        )
+        assert datagram.keys(include_meta_columns=["__pod_id", "__oth"]) == (
+            "a",
+            "__pod_id",
+            "__other",
+        )
+        assert datagram.keys(include_meta_columns=[]) == ("a",)
+
+    def test_types_and_dict_by_prefix(self):
+        datagram = self.make_datagram()
+        assert dict(datagram.types(include_meta_columns=["__pod_ts"])) == {
+            "a": int,
+            "__pod_ts": float,
+        }
+        assert datagram.as_dict(include_meta_columns=("__other",)) == {
+            "a": 1,
+            "__other": 3,
+        }
+
+    def test_arrow_by_prefix(self):
+        datagram = self.make_datagram()
+        assert datagram.arrow_schema(include_meta_columns=["__pod"]).names == [
+            "a",
+            "__pod_id",
+            "__pod_ts",
+        ]
+        table = datagram.as_table(include_meta_columns=["__pod_ts"])
+        assert table.to_pylist() == [{"a": 1, "__pod_ts": 2.0}]
+        # repeated selections are served from the cache
+        assert datagram.as_table(include_meta_columns=["__pod_ts"]).equals(table)
+        assert datagram.as_table(include_meta_columns=["__zz"]).column_names == ["a"]
+
+    def test_selection_cache_is_created_on_first_use(self):
+        datagram = self.make_datagram()
+        assert datagram._meta_prefix_select_cache is None
+        datagram.arrow_schema(include_meta_columns=["__pod"])
+        assert frozenset(["__pod"]) in datagram._meta_prefix_select_cache
+        assert datagram.copy()._meta_prefix_select_cache is not None
+        assert datagram.copy(include_cache=False)._meta_prefix_select_cache is None
+
+
+class TestSemanticConverterCache:
+    def test_registering_semantic_type_updates_converters(self):
+        default_context = DataContext.resolve_data_context(None)
+        registry = SemanticTypeRegistry()
+        context = DataContext(
+            "test:registry",
+            registry,
+            default_context.arrow_hasher,
+            default_context.object_hasher,
+        )
+        DictDatagram({"p": Path("/tmp/x")}, data_context=context)
+        generation = registry.generation
+        registry.register_semantic_type(SEMANTIC_PATH)
+        assert registry.generation > generation
+
+        datagram = DictDatagram({"p": Path("/tmp/x")}, data_context=context)
+        assert datagram.as_table().to_pylist() == [{"p": "/tmp/x"}]
+
+
+class TestContentHash:
+    def test_equal_content_hashes_equal(self):
+        first = DictDatagram({"a": 1, "b": "x", "__m": 1})
+        second = DictDatagram({"a": 1, "b": "x", "__m": 2})
+        assert first.content_hash() == second.content_hash()
+        assert first.content_hash() != DictDatagram({"a": 2, "b": "x"}).content_hash()
+
+    def test_cached_hash_matches_computed_hash(self):
+        datagram = DictDatagram({"a": 3, "b": "cached"})
+        expected = datagram.content_hash()
+        cached = DictDatagram({"a": 3, "b": "cached"})
+        assert cached._content_hash_key() in DictDatagram._content_hash_cache
+        assert cached.content_hash() == expected
+
+    def test_equal_comparing_values_of_other_types_hash_differently(self):
+        hashes = {DictDatagram({"a": value}).content_hash() for value in (1, 1.0, True)}
+        assert len(hashes) == 3
+
+    def test_signed_zero_is_not_cached(self):
+        assert DictDatagram({"a": -0.0})._content_hash_key() is None
+        assert (
+            DictDatagram({"a": 0.0}).content_hash()
+            != DictDatagram({"a": -0.0}).content_hash()
+        )
+
+    def test_non_primitive_values_are_not_cached(self):
+        assert DictDatagram({"a": Path("/tmp/x")})._content_hash_key() is None
+
+    def test_large_values_are_not_cached(self):
+        limit = DictDatagram._CONTENT_HASH_KEY_MAX_SIZE
+        assert DictDatagram({"a": "x" * limit})._content_hash_key() is not None
+        large = DictDatagram({"a": "x" * limit, "b": "y"})
+        assert large._content_hash_key() is None
+        assert large.content_hash() == (
+            DictDatagram({"a": "x" * limit, "b": "y"}).content_hash()
+        )
+
+    def test_cache_is_bounded(self):
+        for i in range(DictDatagram._CONTENT_HASH_CACHE_SIZE + 10):
+            DictDatagram({"bounded": i}).content_hash()
+        assert len(DictDatagram._content_hash_cache) <= (
+            DictDatagram._CONTENT_HASH_CACHE_SIZE
+        )
+
+
+class TestDerivedDatagrams:
+    def make_datagram(self):
+        return DictDatagram(
+            {"a": 1, "b": "x", "__m": 2.0, constants.CONTEXT_KEY: "std:v0.1.0:default"}
+        )
+
+    def test_rename_without_affected_columns_returns_self(self):
+        datagram = self.make_datagram()
+        assert datagram.rename({"zz": "y"}) is datagram
+        renamed = datagram.rename({"a": "A"})
+        assert renamed.keys() == ("A", "b")
+        assert dict(renamed.types()) == {"A": int, "b": str}
+
+    def test_meta_updates_keep_data_caches(self):
+        datagram = self.make_datagram()
+        table = datagram.as_table()
+        content_hash = datagram.content_hash()
+        derived = datagram.with_meta_columns(q=1)
+        assert derived.meta_columns == ("__m", "__q")
+        assert derived.as_table() is table
+        assert derived.content_hash() == content_hash
+        dropped = datagram.drop_meta_columns("m")
+        assert dropped.meta_columns == ()
+        assert dropped.as_table() is table
+
+    def test_data_updates_reset_data_caches(self):
+        datagram = self.make_datagram()
+        content_hash = datagram.content_hash()
+        updated = datagram.update(a=5)
+        assert updated["a"] == 5
+        assert updated.meta_columns == datagram.meta_columns
+        assert updated.content_hash() != content_hash
+        assert datagram["a"] == 1
+
+    def test_copy(self):
+        datagram = self.make_datagram()
+        content_hash = datagram.content_hash()
+        for copied in (datagram.copy(), datagram.copy(include_cache=False)):
+            assert copied.as_dict(include_all_info=True) == datagram.as_dict(
+                include_all_info=True
+            )
+            assert copied.content_hash() == content_hash
+        copied = datagram.copy()
+        assert copied.with_meta_columns(q=1).meta_columns == ("__m", "__q")
+        assert datagram.meta_columns == ("__m",)
+
+    def test_as_table_column_order(self):
+        datagram = self.make_datagram()
+        table = datagram.as_table(include_all_info=True)
+        assert table.column_names == ["a", "b", constants.CONTEXT_KEY, "__m"]
+        assert table.to_pylist() == [
+            {
+                "a": 1,
+                "b": "x",
+                constants.CONTEXT_KEY: "std:v0.1.0:default",
+                "__m": 2.0,
+            }
+        ]
+        assert datagram.as_table(include_context=True).column_names == [
+            "a",
+            "b",
+            constants.CONTEXT_KEY,
+        ]
+        assert datagram.arrow_schema(include_all_info=True).names == table.column_names
+
+
+class ColumnTypes(Mapping):
+    """Read-only mapping that is not a dict."""
+
+    def __init__(self, types):
+        self._types = dict(types)
+
+    def __getitem__(self, key):
+        return self._types[key]
+
+    def __iter__(self):
+        return iter(self._types)
+
+    def __len__(self):
+        return len(self._types)
+
+
+class TestWithColumns:
+    def test_column_types_from_any_mapping(self):
+        datagram = DictDatagram({"a": 1})
+        extended = datagram.with_columns(ColumnTypes({"z": int}), z=None)
+        assert dict(extended.types()) == {"a": int, "z": int}
+        assert dict(datagram.types()) == {"a": int}
+
+    def test_inferred_column_types(self):
+        datagram = DictDatagram({"a": 1})
+        assert dict(datagram.with_columns(y=3.0).types()) == {"a": int, "y": float}
+        assert datagram.with_columns() is datagram
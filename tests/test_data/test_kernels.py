@@ -0,0 +1,88 @@
+"""Tests for the invocation caches of TrackedKernelBase."""
+
+import gc
+import weakref
+
+from orcapod.data.operators import MapPackets
+from orcapod.data.pods import function_pod
+from orcapod.data.sources import DictSource
+from orcapod.data.trackers import GraphTracker
+
+
+@function_pod(output_keys="total")
+def add(v: int, w: int) -> int:
+    return v + w
+
+
+def make_sources():
+    s1 = DictSource(tags=[{"id": 1}, {"id": 2}], packets=[{"v": 1}, {"v": 2}])
+    s2 = DictSource(tags=[{"id": 1}, {"id": 2}], packets=[{"w": 10}, {"w": 20}])
+    return s1, s2
+
+
+def invoked_kernels(tracker):
+    return sorted(type(inv.kernel).__name__ for inv in tracker.kernel_invocations)
+
+
+def test_pre_kernel_processing_is_tracked_after_output_types():
+    s1, s2 = make_sources()
+    add.output_types(s1, s2)
+    with GraphTracker() as tracker:
+        add(s1, s2)
+    assert "Join" in invoked_kernels(tracker)
+
+
+def test_repeated_invocations_reuse_validation():
+    s1, _ = make_sources()
+    kernel = MapPackets({"v": "vv"})
+    calls = []
+    validate_inputs = kernel.validate_inputs
+
+    def counting_validate_inputs(*streams):
+        calls.append(streams)
+        validate_inputs(*streams)
+
+    kernel.validate_inputs = counting_validate_inputs
+    kernel.output_types(s1)
+    kernel.identity_structure((s1,))
+    kernel(s1)
+    assert len(calls) == 1
+
+
+def test_kernels_do_not_keep_input_streams_alive():
+    source, _ = make_sources()
+    stream = source()
+    kernel = MapPackets({"v": "vv"})
+    kernel(stream).as_table()
+    kernel.output_types(stream)
+    stream_ref = weakref.ref(stream)
+    del source, stream
+    gc.collect()
+    assert stream_ref() is None
+    assert not kernel._prepared_cache
+    assert not kernel._output_types_cache
+
+
+def test_output_types_are_copies():
+    s1, _ = make_sources()
+    kernel = MapPackets({"v": "vv"})
+    _, packet_types = kernel.output_types(s1)
+    packet_types["vv"] = str
+    assert kernel.output_types(s1)[1]["vv"] is int
+
+
+def test_modification_invalidates_caches():
+    s1, _ = make_sources()
+    kernel = MapPackets({"v": "vv"})
+    kernel.output_types(s1)
+    kernel_id = kernel.kernel_id
+    kernel._set_modified_time(invalidate=True)
+    assert not kernel._prepared_cache
+    assert not kernel._output_types_cache
+    assert kernel.kernel_id == kernel_id
+
+
+def test_sources_compute_output_types_without_streams():
+    s1, _ = make_sources()
+    assert s1.output_types() == ({"id": int}, {"v": int})
+    assert s1.identity_structure(()) == s1.identity_structure()
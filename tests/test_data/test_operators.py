@@ -0,0 +1,66 @@
+"""Tests for the identity and arity handling of the stream operators."""
+
+import pytest
+
+from orcapod.data.operators import Join, MapPackets, SemiJoin
+from orcapod.data.sources import DictSource
+
+
+def make_source(name, values):
+    # DictSource identity covers its tag and packet schemas, so sources are told
+    # apart by their packet column names and types
+    return DictSource(
+        tags=[{"id": i} for i in range(len(values))],
+        packets=[{name: v} for v in values],
+    )
+
+
+def invocation_hash(kernel, streams):
+    return kernel.data_context.object_hasher.hash_to_hex(
+        kernel.identity_structure(streams)
+    )
+
+
+class TestUnaryOperatorIdentity:
+    def test_identity_depends_on_the_stream(self):
+        s1 = make_source("v", [1, 2])
+        s2 = make_source("v", [3.0, 4.0])
+        kernel = MapPackets({"v": "w"})
+        assert kernel.identity_structure((s1,)) != kernel.identity_structure()
+        assert invocation_hash(kernel, (s1,)) != invocation_hash(kernel, (s2,))
+
+    def test_wrong_number_of_streams(self):
+        s1 = make_source("v", [1])
+        with pytest.raises(ValueError, match="exactly one input stream"):
+            MapPackets({"v": "w"})(s1, s1)
+
+
+class TestBinaryOperatorIdentity:
+    def test_identity_depends_on_the_streams(self):
+        s1 = make_source("v", [1, 2])
+        s2 = make_source("w", [3, 4])
+        s3 = make_source("x", [5, 6])
+        kernel = SemiJoin()
+        assert kernel.identity_structure((s1, s2)) != kernel.identity_structure()
+        assert invocation_hash(kernel, (s1, s2)) != invocation_hash(kernel, (s1, s3))
+
+    def test_identity_is_ordered(self):
+        s1 = make_source("v", [1, 2])
+        s2 = make_source("w", [3, 4])
+        kernel = SemiJoin()
+        assert invocation_hash(kernel, (s1, s2)) != invocation_hash(kernel, (s2, s1))
+
+
+class TestJoinIdentity:
+    def test_identity_is_commutative(self):
+        s1 = make_source("v", [1, 2])
+        s2 = make_source("w", [3, 4])
+        kernel = Join()
+        assert invocation_hash(kernel, (s1, s2)) == invocation_hash(kernel, (s2, s1))
+
+    def test_identity_depends_on_the_streams(self):
+        s1 = make_source("v", [1, 2])
+        s2 = make_source("w", [3, 4])
+        s3 = make_source("x", [5, 6])
+        kernel = Join()
+        assert invocation_hash(kernel, (s1, s2)) != invocation_hash(kernel, (s1, s3))
@@ -0,0 +1,98 @@
+"""Tests for invocation batching in BasicTrackerManager."""
+
+import pytest
+
+from orcapod.data.sources import DictSource
+from orcapod.data.trackers import BasicTrackerManager, GraphTracker
+
+
+class RecordingTracker:
+    def __init__(self) -> None:
+        self.records = []
+
+    def is_active(self) -> bool:
+        return True
+
+    def record_kernel_invocation(self, kernel, upstreams, label=None) -> None:
+        self.records.append(("kernel", kernel, upstreams, label))
+
+    def record_source_invocation(self, source, label=None) -> None:
+        self.records.append(("source", source, label))
+
+    def record_pod_invocation(self, pod, upstreams, label=None) -> None:
+        self.records.append(("pod", pod, upstreams, label))
+
+
+@pytest.fixture
+def manager():
+    return BasicTrackerManager()
+
+
+@pytest.fixture
+def tracker(manager):
+    tracker = RecordingTracker()
+    manager.register_tracker(tracker)
+    return tracker
+
+
+def test_batch_defers_recording_until_exit(manager, tracker):
+    with manager.batch():
+        manager.record_source_invocation("src", label="s")
+        manager.record_kernel_invocation("k", ("src",))
+        manager.record_pod_invocation("p", ("k",), label="p")
+        assert tracker.records == []
+    assert tracker.records == [
+        ("source", "src", "s"),
+        ("kernel", "k", ("src",), None),
+        ("pod", "p", ("k",), "p"),
+    ]
+
+
+def test_nested_batches_record_on_outermost_exit(manager, tracker):
+    with manager.batch():
+        with manager.batch():
+            manager.record_kernel_invocation("k", ())
+        assert tracker.records == []
+    assert tracker.records == [("kernel", "k", (), None)]
+
+
+def test_no_tracking_within_batch_is_not_recorded(manager, tracker):
+    with manager.batch():
+        manager.record_kernel_invocation("k1", ())
+        with manager.no_tracking():
+            manager.record_kernel_invocation("hidden", ())
+        manager.record_kernel_invocation("k2", ())
+    assert [record[1] for record in tracker.records] == ["k1", "k2"]
+
+
+def test_batch_records_in_trackers_active_at_invocation(manager, tracker):
+    with manager.batch():
+        manager.record_kernel_invocation("before", ())
+        late_tracker = RecordingTracker()
+        manager.register_tracker(late_tracker)
+        manager.record_kernel_invocation("after", ())
+    assert [record[1] for record in tracker.records] == ["before", "after"]
+    assert [record[1] for record in late_tracker.records] == ["after"]
+
+
+def test_tracker_leaving_a_batch_keeps_its_invocations(manager, tracker):
+    with manager.batch():
+        manager.record_kernel_invocation("seen", ())
+        manager.deregister_tracker(tracker)
+        assert [record[1] for record in tracker.records] == ["seen"]
+        manager.record_kernel_invocation("unseen", ())
+    assert [record[1] for record in tracker.records] == ["seen"]
+
+
+def test_graph_tracker_exiting_within_a_batch(manager):
+    source = DictSource(tags=[{"id": 1}], packets=[{"v": 1}])
+    with manager.batch():
+        with GraphTracker(tracker_manager=manager) as graph_tracker:
+            manager.record_kernel_invocation(source, ())
+        assert len(graph_tracker.kernel_invocations) == 1
+    assert len(graph_tracker.kernel_invocations) == 1
+
+
+def test_unbalanced_end_batch_raises(manager):
+    with pytest.raises(RuntimeError):
+        manager.end_batch()